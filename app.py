@@ -1,8 +1,7 @@
 from fastapi import FastAPI
 from fastapi.exceptions import HTTPException, RequestValidationError
 from fastapi import BackgroundTasks, Depends, FastAPI, Request, status
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from routers.user_routers import user_router
 from routers.stats_routers import stats_router
 from core.database import engine, Base
@@ -13,6 +12,7 @@ Base.metadata.create_all(bind=engine)
 app = FastAPI(
     title="Auth Service",
     docs_url="/",
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {"name": "User", "description":"User related operations"},
         {"name": "Stats","description": "Provides statistics for the user."}
@@ -38,7 +38,7 @@ async def validation_error_handler(request: Request, exception: RequestValidatio
 
     Returns
     -------
-    JSONResponse
+    ORJSONResponse
         A JSON response indicating the status and details of the validation error.
 
         If the payload is empty:
@@ -63,23 +63,19 @@ async def validation_error_handler(request: Request, exception: RequestValidatio
     field_errors = exception.errors()
     filed = field_errors[0].get("loc")
     if isinstance(filed[1], int):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
-            content=jsonable_encoder(
-                {
-                    "status_code": "SCR400",
-                    "message": "Empty Payload",
-                }
-            ),
+            content={
+                "status_code": "SCR400",
+                "message": "Empty Payload",
+            },
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
-            content=jsonable_encoder(
-                {
-                    "status_code": "SCR400",
-                    "message": "Invalid " + ", " + " ,".join(str(s) for s in filed[1:]),
-                    "reason": field_errors[0].get("msg"),
-                }
-            ),
+            content={
+                "status_code": "SCR400",
+                "message": "Invalid " + ", " + " ,".join(str(s) for s in filed[1:]),
+                "reason": field_errors[0].get("msg"),
+            },
         )
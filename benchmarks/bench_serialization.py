@@ -0,0 +1,61 @@
+"""
+Benchmark the cost of serializing large stats payloads.
+
+Compares the previous path (untyped list of dicts -> jsonable_encoder -> JSONResponse)
+with the current one (response_model validation/serialization -> ORJSONResponse).
+
+Usage:
+    python benchmarks/bench_serialization.py [rows] [repeat]
+"""
+import os
+import sys
+import asyncio
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from models.stats_models import OrgRoleUserCount
+
+
+def build_payload(rows: int) -> list:
+    '''Build an org-role-wise-users style payload with the given number of rows.'''
+    return [
+        {"organization": f"Organization {i // 5}", "role": f"Role {i % 5}", "user_count": i}
+        for i in range(rows)
+    ]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    payload = build_payload(rows)
+
+    app = FastAPI()
+
+    @app.get("/org-role-wise-users", response_model=list[OrgRoleUserCount])
+    def org_role_wise_users():
+        return payload
+
+    response_field = app.routes[-1].response_field
+
+    def untyped_stdlib():
+        return JSONResponse(content=jsonable_encoder(payload)).body
+
+    def typed_orjson():
+        content = asyncio.run(serialize_response(field=response_field, response_content=payload, is_coroutine=False))
+        return ORJSONResponse(content=content).body
+
+    assert len(untyped_stdlib()) > 0 and len(typed_orjson()) > 0
+
+    print(f"Serializing {rows} rows, best of {repeat} runs")
+    for name, func in [("jsonable_encoder + json", untyped_stdlib), ("response_model + orjson", typed_orjson)]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:<26}{best * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
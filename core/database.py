@@ -1,17 +1,252 @@
 import os
-from sqlalchemy import create_engine
+import time
+import logging
+import itertools
+import threading
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# Comma separated list of read replica URLs. Reads fall back to the primary when empty.
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+# Replica selection strategy: "round_robin" or "least_busy".
+REPLICA_STRATEGY = os.getenv('REPLICA_STRATEGY', 'round_robin')
+if REPLICA_STRATEGY not in ("round_robin", "least_busy"):
+    raise ValueError(f"Invalid REPLICA_STRATEGY {REPLICA_STRATEGY!r}, expected 'round_robin' or 'least_busy'")
+# Replicas lagging behind the primary by more than this many seconds are skipped.
+REPLICA_MAX_LAG = float(os.getenv('REPLICA_MAX_LAG', '5'))
+# How often (in seconds) a replica's lag is re-checked.
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv('REPLICA_LAG_CHECK_INTERVAL', '5'))
+# How long (in seconds) reads for a recently written key are pinned to the primary.
+READ_YOUR_WRITES_WINDOW = float(os.getenv('READ_YOUR_WRITES_WINDOW', '10'))
+# Connect timeout (in seconds) for replicas, so a dead replica fails fast.
+REPLICA_CONNECT_TIMEOUT = int(os.getenv('REPLICA_CONNECT_TIMEOUT', '2'))
+
+
+def _create_replica_engine(url: str):
+    '''Create a replica engine with a short connect timeout where the driver supports one.'''
+    connect_args = {}
+    if make_url(url).get_backend_name() in ("mysql", "mariadb", "postgresql"):
+        connect_args["connect_timeout"] = REPLICA_CONNECT_TIMEOUT
+    return create_engine(url, connect_args=connect_args)
+
+
 engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+replica_engines = [_create_replica_engine(url) for url in DATABASE_REPLICA_URLS]
 Base = declarative_base()
 
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica and everything else to the primary.
+
+    The replica is taken from ``info["read_bind"]``. Flushes, and sessions pinned with
+    ``info["use_primary"]``, always use the primary engine. If the replica fails with an
+    OperationalError (e.g. it went down since its last lag check), it is marked unavailable
+    and the statement is retried on the primary.
+    """
+
+    def _reads_from_replica(self) -> bool:
+        return self.info.get("read_bind") is not None and not self.info.get("use_primary")
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self._reads_from_replica() or self._flushing:
+            return engine
+        return self.info["read_bind"]
+
+    def execute(self, *args, **kwargs):
+        if not self._reads_from_replica():
+            return super().execute(*args, **kwargs)
+        try:
+            return super().execute(*args, **kwargs)
+        except OperationalError as error:
+            replica = self.info["read_bind"]
+            logging.warning(f"Read from replica {replica.url!r} failed, retrying on primary: {str(error)}")
+            mark_unavailable(replica)
+            self.rollback()
+            self.info["use_primary"] = True
+            return super().execute(*args, **kwargs)
+
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+_lock = threading.Lock()
+_round_robin = itertools.cycle(range(len(replica_engines)))
+_replica_lag = {}
+_recent_writes = {}
+
+
+def replica_lag(replica) -> float:
+    """
+    Measure how far a replica is behind the primary.
+
+    Args:
+        replica (Engine): The replica engine.
+
+    Returns:
+        float: The replication lag in seconds. Dialects without replication status
+        (e.g. SQLite stand-ins) report 0.
+
+    Raises:
+        SQLAlchemyError: If the replica can't be reached, or the replica user lacks the
+        REPLICATION CLIENT privilege needed to read replication status.
+    """
+    if replica.dialect.name not in ("mysql", "mariadb"):
+        with replica.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        return 0.0
+
+    with replica.connect() as connection:
+        try:
+            status = connection.execute(text("SHOW REPLICA STATUS")).mappings().first()
+        except SQLAlchemyError:
+            # MySQL < 8.0.22 and MariaDB < 10.5.1 only know the legacy statement
+            connection.rollback()
+            status = connection.execute(text("SHOW SLAVE STATUS")).mappings().first()
+    return _lag_from_status(status)
+
+
+def _lag_from_status(status) -> float:
+    """
+    Read the replication lag from a SHOW REPLICA/SLAVE STATUS row.
+
+    MySQL 8.0.22+ names the column Seconds_Behind_Source; older MySQL and MariaDB
+    (even when answering SHOW REPLICA STATUS) use Seconds_Behind_Master.
+
+    Args:
+        status (Mapping | None): The status row, or None if the server isn't a replica.
+
+    Returns:
+        float: The lag in seconds, or infinity when replication is stopped (NULL lag).
+
+    Raises:
+        ValueError: If the row has neither lag column.
+    """
+    if status is None:
+        return 0.0
+    for column in ("Seconds_Behind_Source", "Seconds_Behind_Master"):
+        if column in status:
+            lag = status[column]
+            # A NULL lag means replication is stopped
+            return float("inf") if lag is None else float(lag)
+    raise ValueError("Replication status has no Seconds_Behind_Source/Seconds_Behind_Master column")
+
+
+def _is_healthy(replica) -> bool:
+    """
+    Check a replica's lag against REPLICA_MAX_LAG, re-probing at most every REPLICA_LAG_CHECK_INTERVAL.
+
+    Only one caller probes a replica at a time: it claims the probe by stamping the check time
+    under the lock, while concurrent callers keep using the cached lag. Replicas that haven't
+    been probed yet count as unhealthy.
+    """
+    now = time.monotonic()
+    with _lock:
+        lag, checked_at = _replica_lag.get(replica, (float("inf"), None))
+        should_probe = checked_at is None or now - checked_at >= REPLICA_LAG_CHECK_INTERVAL
+        if should_probe:
+            _replica_lag[replica] = (lag, now)
+
+    if should_probe:
+        try:
+            lag = replica_lag(replica)
+        except Exception as error:
+            logging.warning(f"Replica {replica.url!r} unavailable: {str(error)}")
+            lag = float("inf")
+        with _lock:
+            _replica_lag[replica] = (lag, now)
+    return lag <= REPLICA_MAX_LAG
+
+
+def mark_unavailable(replica):
+    '''Treat a replica as unhealthy until its next lag check.'''
+    with _lock:
+        _replica_lag[replica] = (float("inf"), time.monotonic())
+
+
+def _checked_out(replica) -> int:
+    '''Number of connections currently in use on a replica's pool.'''
+    checkedout = getattr(replica.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+def select_replica():
+    """
+    Pick a healthy replica according to REPLICA_STRATEGY.
+
+    Returns:
+        Engine | None: A replica engine, or None when no replica is configured or every
+        replica is lagging/unavailable, in which case reads go to the primary.
+    """
+    if not replica_engines:
+        return None
+
+    if REPLICA_STRATEGY == "least_busy":
+        candidates = sorted(replica_engines, key=_checked_out)
+    else:
+        with _lock:
+            start = next(_round_robin)
+        candidates = replica_engines[start:] + replica_engines[:start]
+
+    for replica in candidates:
+        if _is_healthy(replica):
+            return replica
+
+    logging.warning("No healthy read replica available, falling back to primary")
+    return None
+
+
+def mark_written(key: str):
+    """
+    Record a write for a key so reads for it are served by the primary for a while.
+
+    Writes are tracked in memory, so the guarantee only holds for reads served by the same
+    process; with several workers or instances a read may still land on a stale replica.
+
+    Args:
+        key (str): Identifies the written data, e.g. the user's email. Compared case-insensitively.
+    """
+    now = time.monotonic()
+    with _lock:
+        # Drop expired keys so the dict doesn't grow with every write
+        for expired in [k for k, expires_at in _recent_writes.items() if expires_at <= now]:
+            del _recent_writes[expired]
+        _recent_writes[key.lower()] = now + READ_YOUR_WRITES_WINDOW
+
+
+def written_recently(key: str) -> bool:
+    '''Check whether a key was written within READ_YOUR_WRITES_WINDOW (case-insensitive).'''
+    key = key.lower()
+    now = time.monotonic()
+    with _lock:
+        expires_at = _recent_writes.get(key)
+        if expires_at is not None and expires_at <= now:
+            del _recent_writes[key]
+            expires_at = None
+    return expires_at is not None
+
+
+def use_primary_if_written(db: Session, key: str):
+    """
+    Pin a read session to the primary if the key was written recently (read-your-writes).
+
+    Must be called before the session runs its first query.
+
+    Args:
+        db (Session): A session from get_read_db.
+        key (str): The key passed to mark_written.
+    """
+    if written_recently(key):
+        db.info["use_primary"] = True
+
+
 def get_db():
     """
     Provides a database session for dependency injection.
@@ -25,4 +260,23 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_read_db():
+    """
+    Provides a read-only database session for dependency injection.
+
+    Queries are routed to a healthy read replica, falling back to the primary when
+    no replica is configured or all of them are lagging.
+
+    Yields:
+        Session: A SQLAlchemy session instance.
+
+    Closes the session after use.
+    """
+    db = ReadSessionLocal(info={"read_bind": select_replica()})
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+class RoleUserCount(BaseModel):
+    role: str
+    user_count: int
+
+class OrgMemberCount(BaseModel):
+    organization: str
+    member_count: int
+
+class OrgRoleUserCount(BaseModel):
+    organization: str
+    role: str
+    user_count: int
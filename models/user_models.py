@@ -22,4 +22,13 @@ class ResetPassword(BaseModel):
 class InviteMail(BaseModel): 
     org_id: int 
     user_email: EmailStr
-    role_id: int
\ No newline at end of file
+    role_id: int
+
+class TokenResponse(BaseModel):
+    access_token: str
+    refresh_token: str
+
+class SignUpResponse(BaseModel):
+    message: str
+    user_id: int
+    org_id: int
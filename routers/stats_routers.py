@@ -4,19 +4,20 @@ from sqlalchemy import func
 from schemas.organization import Organization
 from schemas.role import Role
 from schemas.member import Member
-from core.database import get_db
+from core.database import get_read_db
+from models.stats_models import RoleUserCount, OrgMemberCount, OrgRoleUserCount
 import logging
 from sqlalchemy.exc import SQLAlchemyError
 
 stats_router = APIRouter()
 
-@stats_router.get("/role-wise-users")
-def role_wise_users(db: Session = Depends(get_db)):
+@stats_router.get("/role-wise-users", response_model=list[RoleUserCount])
+def role_wise_users(db: Session = Depends(get_read_db)):
     """
     Retrieve the count of users grouped by their roles.
 
     Args:
-        db (Session): The database session dependency.
+        db (Session): The read-only database session dependency.
 
     Returns:
         list: A list of dictionaries containing role names and user counts.
@@ -40,13 +41,13 @@ def role_wise_users(db: Session = Depends(get_db)):
         logging.error(f"Unexpected error during role-wise user count retrieval: {str(error)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@stats_router.get("/org-wise-members")
-def org_wise_members(db: Session = Depends(get_db)):
+@stats_router.get("/org-wise-members", response_model=list[OrgMemberCount])
+def org_wise_members(db: Session = Depends(get_read_db)):
     """
     Retrieve the count of members grouped by their organizations.
 
     Args:
-        db (Session): The database session dependency.
+        db (Session): The read-only database session dependency.
 
     Returns:
         list: A list of dictionaries containing organization names and member counts.
@@ -70,13 +71,13 @@ def org_wise_members(db: Session = Depends(get_db)):
         logging.error(f"Unexpected error during organization-wise member count retrieval: {str(error)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@stats_router.get("/org-role-wise-users")
-def org_role_wise_users(db: Session = Depends(get_db)):
+@stats_router.get("/org-role-wise-users", response_model=list[OrgRoleUserCount])
+def org_role_wise_users(db: Session = Depends(get_read_db)):
     """
     Retrieve the count of users grouped by their organizations and roles.
 
     Args:
-        db (Session): The database session dependency.
+        db (Session): The read-only database session dependency.
 
     Returns:
         list: A list of dictionaries containing organization names, role names, and user counts.
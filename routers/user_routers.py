@@ -1,6 +1,6 @@
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from core.security import create_access_token, verify_password, get_password_hash
 from schemas.user import User
@@ -8,31 +8,33 @@ from schemas.organization import Organization
 from schemas.role import Role
 from schemas.member import Member
 from services.email import send_invite_email, send_password_update_email
-from models.user_models import SignIn, SignUp, ResetPassword, InviteMail
-from core.database import get_db
+from models.user_models import SignIn, SignUp, ResetPassword, InviteMail, TokenResponse, SignUpResponse
+from core.database import get_db, get_read_db, mark_written, use_primary_if_written
 import logging
 from sqlalchemy.exc import SQLAlchemyError
 
 user_router = APIRouter()
 
-@user_router.post("/signin")
-def sign_in(sign_in: SignIn, db: Session = Depends(get_db)):
+@user_router.post("/signin", response_model=TokenResponse)
+def sign_in(sign_in: SignIn, db: Session = Depends(get_read_db)):
     """
     Sign in the user by verifying credentials and issuing access and refresh tokens.
     
     Args:
         sign_in (SignIn): The user's sign-in credentials (email and password).
-        db (Session): The database session dependency.
+        db (Session): The read-only database session dependency.
     
     Returns:
         dict: A dictionary containing the access and refresh tokens.
     """
 
     try:
+        # Read from the primary if this user just signed up or reset their password
+        use_primary_if_written(db, sign_in.email)
         user = db.query(User).filter(User.email == sign_in.email).first()
         if not user or not verify_password(sign_in.password, user.password):
             logging.warning(f"Invalid sign-in attempt for email: {sign_in.email}")
-            return JSONResponse(status_code=400, content="Invalid credentials")
+            return ORJSONResponse(status_code=400, content="Invalid credentials")
         
         access_token = create_access_token(data={"sub": user.email})
         refresh_token = create_access_token(data={"sub": user.email}, expires_in=7*24*60*60)
@@ -43,7 +45,7 @@ def sign_in(sign_in: SignIn, db: Session = Depends(get_db)):
         logging.error(f"Error during sign-in: {str(error)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@user_router.post("/signup")
+@user_router.post("/signup", response_model=SignUpResponse)
 def sign_up(sign_up: SignUp, db: Session = Depends(get_db)):
     """
     Sign up a new user and create an organization entry.
@@ -62,7 +64,7 @@ def sign_up(sign_up: SignUp, db: Session = Depends(get_db)):
         # Check if user already exists
         existing_user = db.query(User).filter(User.email == sign_up.email).first()
         if existing_user:
-            return JSONResponse(status_code=400, content="User already exists")
+            return ORJSONResponse(status_code=400, content="User already exists")
 
         # Create the organization entry
         new_organization = Organization(
@@ -109,6 +111,7 @@ def sign_up(sign_up: SignUp, db: Session = Depends(get_db)):
         )
         db.add(new_member)
         db.commit()  # Commit here for member
+        mark_written(sign_up.email)
 
         send_invite_email(sign_up.email)
 
@@ -140,11 +143,12 @@ def reset_password(reset: ResetPassword, db: Session = Depends(get_db)):
     try:
         user = db.query(User).filter(User.email == reset.email).first()
         if not user:
-            return JSONResponse(status_code=400, content="User not found")
+            return ORJSONResponse(status_code=400, content="User not found")
         
         # Update the user's password
         user.password = get_password_hash(reset.new_password)
         db.commit()
+        mark_written(user.email)
 
         # Send password update email
         send_password_update_email(user.email)
@@ -177,7 +181,7 @@ def invite_member(payload: InviteMail, db: Session = Depends(get_db)):
     try:
         user = db.query(User).filter(User.email == payload.user_email).first()
         if not user:
-            return JSONResponse(status_code=400, content="User not found")
+            return ORJSONResponse(status_code=400, content="User not found")
 
         # Create the member entry
         member = Member(org_id=payload.org_id, user_id=user.id, role_id=payload.role_id, status=1)
@@ -215,7 +219,7 @@ def delete_member(member_id: int, db: Session = Depends(get_db)):
     try:
         member = db.query(Member).filter(Member.id == member_id).first()
         if not member:
-            return JSONResponse(status_code=400, content="Member not found")
+            return ORJSONResponse(status_code=400, content="Member not found")
         
         db.delete(member)
         db.commit()
@@ -249,7 +253,7 @@ def update_member_role(member_id: int, new_role_id: int, db: Session = Depends(g
     try:
         member = db.query(Member).filter(Member.id == member_id).first()
         if not member:
-            return JSONResponse(status_code=400, content="Member not found")
+            return ORJSONResponse(status_code=400, content="Member not found")
         
         # Update the member's role
         member.role_id = new_role_id
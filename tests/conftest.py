@@ -0,0 +1,11 @@
+import os
+import sys
+import tempfile
+
+# SQLite files stand in for the primary and two read replicas. The settings are read
+# when core.database is imported, so they must be in place before any app import.
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/primary.db"
+os.environ["DATABASE_REPLICA_URLS"] = f"sqlite:///{_db_dir}/replica1.db,sqlite:///{_db_dir}/replica2.db"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,193 @@
+import time
+import threading
+from contextlib import closing
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+import core.database as database
+import routers.user_routers as user_routers
+from app import app
+from core.database import Base, engine, replica_engines
+from schemas.user import User
+
+client = TestClient(app)
+
+for replica in replica_engines:
+    Base.metadata.create_all(bind=replica)
+
+
+@pytest.fixture(autouse=True)
+def reset_state(monkeypatch):
+    '''Start every test with empty databases, no cached lag and no pinned keys.'''
+    monkeypatch.setattr(user_routers, "send_invite_email", lambda *args: None)
+    monkeypatch.setattr(user_routers, "send_password_update_email", lambda *args: None)
+    for bind in [engine, *replica_engines]:
+        with bind.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
+    database._replica_lag.clear()
+    database._recent_writes.clear()
+
+
+def replicate_users():
+    '''Copy the primary's users to every replica, as replication would.'''
+    with engine.connect() as connection:
+        rows = [dict(row) for row in connection.execute(User.__table__.select()).mappings()]
+    for replica in replica_engines:
+        with replica.begin() as connection:
+            connection.execute(User.__table__.insert(), rows)
+
+
+def sign_up(email="user@example.com", password="password"):
+    return client.post("/user/signup", json={"email": email, "password": password, "organization_name": "Org"})
+
+
+def sign_in(email="user@example.com", password="password"):
+    return client.post("/user/signin", json={"email": email, "password": password})
+
+
+def test_round_robin_alternates_replicas(monkeypatch):
+    monkeypatch.setattr(database, "REPLICA_STRATEGY", "round_robin")
+
+    first, second, third = (database.select_replica() for _ in range(3))
+
+    assert {first, second} == set(replica_engines)
+    assert third is first
+
+
+def test_least_busy_picks_replica_with_fewest_connections(monkeypatch):
+    monkeypatch.setattr(database, "REPLICA_STRATEGY", "least_busy")
+
+    with replica_engines[0].connect():
+        assert database.select_replica() is replica_engines[1]
+        with replica_engines[1].connect(), replica_engines[1].connect():
+            assert database.select_replica() is replica_engines[0]
+
+
+def lag_by_replica(lags):
+    '''Build a replica_lag stand-in reporting a fixed lag per replica (0 for unlisted ones).'''
+    return lambda replica: lags.get(replica, 0.0)
+
+
+def test_lagging_replica_is_skipped(monkeypatch):
+    monkeypatch.setattr(database, "replica_lag", lag_by_replica({replica_engines[0]: database.REPLICA_MAX_LAG + 1}))
+
+    assert all(database.select_replica() is replica_engines[1] for _ in range(4))
+
+
+def test_falls_back_to_primary_when_all_replicas_lag(monkeypatch):
+    monkeypatch.setattr(database, "replica_lag", lambda replica: database.REPLICA_MAX_LAG + 1)
+
+    with closing(database.get_read_db()) as sessions:
+        db = next(sessions)
+        assert db.get_bind() is engine
+
+
+def test_falls_back_to_primary_when_replica_unreachable(monkeypatch):
+    unreachable = create_engine("sqlite:////nonexistent-dir/replica.db")
+    monkeypatch.setattr(database, "replica_engines", [unreachable])
+
+    assert database.select_replica() is None
+
+
+def test_replica_going_down_after_probe_falls_back_to_primary(monkeypatch, tmp_path):
+    replica_dir = tmp_path / "replica"
+    replica_dir.mkdir()
+    replica = create_engine(f"sqlite:///{replica_dir}/replica.db")
+    Base.metadata.create_all(bind=replica)
+    monkeypatch.setattr(database, "replica_engines", [replica])
+    assert database.select_replica() is replica
+    assert sign_up().status_code == 200
+    database._recent_writes.clear()
+
+    # Take the replica down between lag checks
+    replica.dispose()
+    for file in replica_dir.iterdir():
+        file.unlink()
+    replica_dir.rmdir()
+
+    assert sign_in().status_code == 200
+    assert client.get("/stats/role-wise-users").json() == [{"role": "Owner", "user_count": 1}]
+    assert database.select_replica() is None
+
+
+def test_lag_is_probed_by_a_single_caller(monkeypatch):
+    probes = []
+
+    def slow_probe(replica):
+        probes.append(replica)
+        time.sleep(0.2)
+        return 0.0
+
+    monkeypatch.setattr(database, "replica_engines", replica_engines[:1])
+    monkeypatch.setattr(database, "replica_lag", slow_probe)
+    threads = [threading.Thread(target=database.select_replica) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(probes) == 1
+
+
+def test_stats_read_from_replica():
+    assert sign_up().status_code == 200
+
+    # The Owner role only exists on the primary
+    assert client.get("/stats/role-wise-users").json() == []
+
+
+def test_sign_in_after_sign_up_reads_from_primary():
+    assert sign_up().status_code == 200
+
+    assert sign_in().status_code == 200
+
+    # Once the window is over the lookup goes to the (still empty) replica
+    database._recent_writes.clear()
+    assert sign_in().status_code == 400
+
+
+def test_sign_in_after_password_reset_reads_from_primary():
+    assert sign_up(password="old-password").status_code == 200
+    replicate_users()
+    database._recent_writes.clear()
+
+    response = client.post("/user/reset-password", json={"email": "user@example.com", "new_password": "new-password"})
+    assert response.status_code == 200
+
+    assert sign_in(password="new-password").status_code == 200
+
+    # The replicas still hold the old password hash
+    database._recent_writes.clear()
+    assert sign_in(password="new-password").status_code == 400
+
+
+def test_written_keys_match_case_insensitively():
+    database.mark_written("user@example.com")
+
+    assert database.written_recently("User@Example.com")
+
+
+def test_expired_written_keys_are_pruned(monkeypatch):
+    monkeypatch.setattr(database, "READ_YOUR_WRITES_WINDOW", 0)
+    for i in range(1000):
+        database.mark_written(f"user{i}@example.com")
+
+    assert len(database._recent_writes) == 1
+
+
+@pytest.mark.parametrize("status, expected", [
+    ({"Seconds_Behind_Source": 3}, 3.0),
+    ({"Seconds_Behind_Master": 7}, 7.0),
+    ({"Seconds_Behind_Source": None}, float("inf")),
+    ({"Seconds_Behind_Master": None}, float("inf")),
+    (None, 0.0),
+])
+def test_lag_from_replication_status(status, expected):
+    assert database._lag_from_status(status) == expected
+
+
+def test_lag_from_replication_status_without_lag_column():
+    with pytest.raises(ValueError):
+        database._lag_from_status({"Replica_IO_Running": "Yes"})